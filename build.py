@@ -0,0 +1,39 @@
+"""
+Poetry build script: compiles the optional tgfmt._tgparser extension when
+Cython and a C compiler are available, and otherwise leaves tgfmt to its
+pure-Python reader
+"""
+
+import shutil
+import sys
+
+from pathlib import Path
+
+
+def build():
+    try:
+        from Cython.Build import cythonize
+        from setuptools import Distribution, Extension
+        from setuptools.command.build_ext import build_ext
+    except ImportError:
+        print('Cython not found, skipping tgfmt._tgparser', file=sys.stderr)
+        return
+
+    extensions = cythonize([Extension('tgfmt._tgparser',
+                                      ['src/tgfmt/_tgparser.pyx'])])
+    command = build_ext(Distribution({'name': 'tgfmt',
+                                      'ext_modules': extensions}))
+    command.ensure_finalized()
+    try:
+        command.run()
+    except Exception as e:  # no compiler, most likely
+        print('Could not build tgfmt._tgparser: {0}'.format(e),
+              file=sys.stderr)
+        return
+    for output in command.get_outputs():
+        target = Path('src') / Path(output).relative_to(command.build_lib)
+        shutil.copyfile(output, target)
+
+
+if __name__ == '__main__':
+    build()
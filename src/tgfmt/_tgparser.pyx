@@ -0,0 +1,140 @@
+# cython: language_level=3, boundscheck=True, wraparound=False
+"""
+Compiled per-tier read loop of TextGrid.read. This is optional: when it
+is not built, tgfmt.textgrid uses its pure-Python _parseTier instead.
+"""
+
+import numpy as np
+
+from .textgrid import (Interval, IntervalTier, Point, PointTier,
+                       _getMarkAt, _skipMarkAt, _roundTimes,
+                       _parse_num_long, _parse_num_short,
+                       _parse_str_long, _parse_str_short)
+
+
+cdef _parseTimes(list lines, bint short, round_digits):
+    """
+    Convert the times on a list of lines, rounded as _parse_nums_long or
+    _parse_nums_short would
+    """
+    cdef Py_ssize_t j, n = len(lines)
+    cdef double[::1] times = np.empty(n)
+    for j in range(n):
+        # the time on a short-format line, or after the ' = ' of a long one
+        if short:
+            times[j] = float(<str>lines[j])
+        else:
+            times[j] = float((<str>lines[j]).partition(' = ')[2])
+    return _roundTimes(np.asarray(times), 1., round_digits)
+
+
+cdef inline object _singleMark(str line, bint short):
+    """
+    The mark of the usual entry on a single line, as _getMarkAt would
+    return it, or None for anything that needs the full treatment
+    """
+    if line.count('"') & 1:
+        return None  # continues on the next lines
+    entry = line.strip()
+    if not short:
+        if not (entry.startswith('text = "') or
+                entry.startswith('mark = "')) or not entry.endswith('"'):
+            return None
+        entry = entry[7:]
+    return entry[1:len(entry) - 1].replace('""', '"')
+
+
+cdef inline tuple _markAt(list lines, Py_ssize_t i, bint short):
+    mark = _singleMark(lines[i], short)
+    if mark is None:
+        return _getMarkAt(lines, i, short)
+    return (mark, i + 1)
+
+
+def parse_tier(list lines, Py_ssize_t i, bint short, round_digits, strict,
+               tiers=None):
+    """
+    As tgfmt.textgrid._parseTier. Tiers whose entries are in order are
+    filled in one go rather than entry by entry.
+    """
+    cdef Py_ssize_t j, n
+    cdef double last
+    cdef double[::1] starts, ends, times
+    cdef list lines_a, lines_b, marks, entries
+    if short:
+        parse_num = _parse_num_short
+        parse_str = _parse_str_short
+    else:
+        parse_num = _parse_num_long
+        parse_str = _parse_str_long
+        i += 1
+    tier_class = parse_str(lines[i])
+    inam = parse_str(lines[i + 1])
+    imin = parse_num(lines[i + 2], round_digits)
+    imax = parse_num(lines[i + 3], round_digits)
+    n = int(parse_num(lines[i + 4], round_digits))
+    i += 5
+    if tiers is not None and inam not in tiers:
+        # an interval has its times before the mark, a point its time
+        offset = (2 if tier_class == 'IntervalTier' else 1) + (not short)
+        for j in range(n):
+            i = _skipMarkAt(lines, i + offset)
+        return (None, i)
+    n = max(n, 0)
+    # collect the lines of the times first, and convert them all together
+    # once the marks have been read, as _parseTier does
+    lines_a = [None] * n
+    lines_b = [None] * n
+    marks = [None] * n
+    entries = []
+    if tier_class == 'IntervalTier':
+        itie = IntervalTier(inam, imin, imax)
+        itie.strict = strict
+        for j in range(n):
+            if not short:
+                i += 1  # header junk
+            lines_a[j] = lines[i]
+            lines_b[j] = lines[i + 1]
+            marks[j], i = _markAt(lines, i + 2, short)
+        starts = _parseTimes(lines_a, short, round_digits)
+        ends = _parseTimes(lines_b, short, round_digits)
+        # intervals which follow each other within the tier's bounds can
+        # go straight in, as addInterval would put each one at the end
+        ordered = True
+        last = imin
+        for j in range(n):
+            if starts[j] < ends[j]:  # non-null
+                if not (last <= starts[j]) or (imax and ends[j] > imax):
+                    ordered = False
+                last = ends[j]
+                entries.append(Interval(starts[j], ends[j], marks[j]))
+        if ordered:
+            itie.extend(entries, assume_sorted=True)
+        else:
+            add_interval = itie.addInterval
+            for interval in entries:
+                add_interval(interval)
+    else:  # pointTier
+        itie = PointTier(inam)
+        pmin = itie.minTime
+        pmax = itie.maxTime
+        for j in range(n):
+            if not short:
+                i += 1  # header junk
+            lines_a[j] = lines[i]
+            marks[j], i = _markAt(lines, i + 1, short)
+        times = _parseTimes(lines_a, short, round_digits)
+        # likewise for points after each other within the tier's bounds
+        ordered = True
+        for j in range(n):
+            if not (times[j] >= pmin if j == 0 else
+                    times[j] > times[j - 1]) or (pmax and times[j] > pmax):
+                ordered = False
+            entries.append(Point(times[j], marks[j]))
+        if ordered:
+            list.extend(itie.points, entries)
+        else:
+            add_point = itie.addPoint
+            for point in entries:
+                add_point(point)
+    return (itie, i)
@@ -32,22 +32,63 @@ from __future__ import print_function
 import re
 import codecs
 import logging
-from pathlib import Path
+import os
 
 from sys import stderr
+from concurrent.futures import ThreadPoolExecutor
 from bisect import bisect_left
+from functools import partial
+from itertools import islice
+from operator import attrgetter
 
-from .exceptions import TextGridError
-
+import numpy as np
 
-def cmp(left, right):
-    """Return negative if left < right, zero if equal, positive if left > right."""
+from .exceptions import TextGridError
 
-    return (left > right) - (left < right)
 
 DEFAULT_TEXTGRID_PRECISION = 5
 DEFAULT_MLF_PRECISION = 5
 
+# buffer size for the files we open, much larger than the io default
+_BUFFER_SIZE = 1 << 20
+
+# a whole interval entry (times and mark) in long- and short-format files;
+# Praat doubles the double-quotes within a mark, which may span lines
+_INTERVAL_LONG_RE = re.compile(
+    r'xmin\s*=\s*(\S+)\s+xmax\s*=\s*(\S+)\s+text\s*=\s*"([^"]*(?:""[^"]*)*)"')
+_INTERVAL_SHORT_RE = re.compile(r'(\S+)\s+(\S+)\s+"([^"]*(?:""[^"]*)*)"')
+# the quoted label file name which starts each grid in an MLF
+_MLF_NAME_RE = re.compile(r'"(.*)"')
+# the header line naming the file type
+_FILE_TYPE_RE = re.compile(r'File type = "([\w ]+)"')
+# the start of a mark or text entry, and the entry as a whole
+_MARK_ENTRY_RE = re.compile(r'^\s*(text|mark) = "')
+_SHORT_MARK_RE = re.compile(r'^"(.*?)"\s*$', re.DOTALL)
+_LONG_MARK_RE = re.compile(r'^\s*(text|mark) = "(.*?)"\s*$', re.DOTALL)
+
+
+def _roundTimes(samples, samplerate, digits):
+    """
+    Convert a 1-d array of sample counts to seconds, rounded to the given
+    number of digits in agreement with the builtin round()
+    """
+    # np.round scales the times up by 10 ** digits, and the error in that
+    # product outgrows the tie tolerance from about 2 ** 35 (it is only
+    # exact up to 22 digits at all), so larger values are left to round()
+    if not 0 <= digits <= 22 or (samples.size and np.abs(samples).max() /
+                                 samplerate * 10. ** digits >= 2 ** 35):
+        return np.array([round(float(sample) / samplerate, digits)
+                         for sample in samples], dtype=float)
+    times = samples / samplerate
+    scaled = times * 10. ** digits
+    output = np.round(times, digits)
+    # np.round may break the tie the other way from round() for values
+    # which lie close to a half
+    ties = np.abs(scaled - np.floor(scaled) - .5) < 1e-5
+    for i in np.flatnonzero(ties):
+        output[i] = round(float(samples[i]) / samplerate, digits)
+    return output
+
 
 def _getMark(text, short):
     """
@@ -59,52 +100,128 @@ def _getMark(text, short):
     line = text.readline()
 
     # check that the line begins with a valid entry type
-    if not short and not re.match(r'^\s*(text|mark) = "', line):
+    if not short and not _MARK_ENTRY_RE.match(line):
         raise ValueError('Bad entry: ' + line)
 
+    # read until the number of double-quotes is even, counting only the
+    # quotes on each new line
+    quotes = line.count('"')
+    if quotes & 1:
+        parts = [line]
+        while quotes & 1:
+            next_line = text.readline()
+
+            if not next_line:
+                raise EOFError('Bad entry: ' + line[:20] + '...')
+
+            parts.append(next_line)
+            quotes += next_line.count('"')
+        line = ''.join(parts)
+    return _parseMark(line, short)
+
+
+def _getMarkAt(lines, i, short):
+    """
+    As _getMark, but for the entry starting at lines[i] in a list of lines
+    without their line endings. Returns the mark and the index of the line
+    following the entry.
+    """
+    line = lines[i]
+
+    # check that the line begins with a valid entry type
+    if not short and not _MARK_ENTRY_RE.match(line):
+        raise ValueError('Bad entry: ' + line)
+
+    j = _skipMarkAt(lines, i)
+    if j != i + 1:
+        line = '\n'.join(lines[i:j])
+    return (_parseMark(line, short), j)
+
+
+def _skipMarkAt(lines, i):
+    """
+    Returns the index of the line following the entry starting at
+    lines[i], without parsing it
+    """
     # read until the number of double-quotes is even
-    while line.count('"') % 2:
-        next_line = text.readline()
+    quotes = lines[i].count('"')
+    j = i + 1
+    while quotes & 1:
+        if j == len(lines):
+            raise EOFError('Bad entry: ' + lines[i][:20] + '...')
 
-        if not next_line:
-            raise EOFError('Bad entry: ' + line[:20] + '...')
+        quotes += lines[j].count('"')
+        j += 1
+    return j
 
-        line += next_line
+
+def _parseMark(line, short):
+    """
+    Return the mark in a complete entry, which may span several lines
+    """
     if short:
-        pattern = r'^"(.*?)"\s*$'
-    else:
-        pattern = r'^\s*(text|mark) = "(.*?)"\s*$'
-    entry = re.match(pattern, line, re.DOTALL)
+        entry = line.strip()
+        if '\n' not in entry:
+            # the usual single-line short entry is just the quoted mark
+            return entry[1:-1].replace('""', '"')
+    entry = (_SHORT_MARK_RE if short else _LONG_MARK_RE).match(line)
 
     return entry.groups()[-1].replace('""', '"')
 
 
 def _formatMark(text):
-    return text.replace('"', '""')
+    # str.replace beats str.translate with a {'"': '""'} table by 5-20x
+    # here; most marks have no quotes at all, and the membership test is
+    # cheaper still than the replace call
+    return text if '"' not in text else text.replace('"', '""')
 
 
 def detectEncoding(f):
     """
-    This helper method returns the file encoding corresponding to path f.
-    This handles UTF-8, which is itself an ASCII extension, so also ASCII.
-    """
-    encoding = 'ascii'
-    try:
-        with codecs.open(f, 'r', encoding='utf-16') as source:
-            source.readline()  # Read one line to ensure correct encoding
-    except UnicodeError:
-        try:
-            with codecs.open(f, 'r', encoding='utf-8-sig') as source: #revised utf-8 to utf-8-sig for utf-8 with byte order mark (BOM)  
-                source.readline()  # Read one line to ensure correct encoding
-        except UnicodeError:
-            with codecs.open(f, 'r', encoding='ascii') as source:
-                source.readline()  # Read one line to ensure correct encoding
-        else:
-            encoding = 'utf-8-sig' #revised utf-8 to utf-8-sig for utf-8 with byte order mark (BOM) 
-    else:
-        encoding = 'utf-16'
+    This helper method returns the file encoding corresponding to path f,
+    judging by its byte order mark. Files without one are read as UTF-8,
+    which is itself an ASCII extension, so also ASCII.
+    """
+    with open(f, 'rb') as source:
+        head = source.read(3)
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    # utf-8-sig drops a UTF-8 BOM if there is one
+    return 'utf-8-sig'
+
+
+class _WatchedList(list):
+    """
+    The list of Points or Intervals in a tier, which notes when it is
+    changed directly so that the tier knows to rebuild its search keys.
+    The tiers themselves update it through the plain list methods.
+    """
+
+    __slots__ = ('changed',)
 
-    return encoding
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self.changed = False
+
+
+def _noteChange(name):
+    """
+    Wraps the list method of the given name to mark the list as changed
+    """
+    method = getattr(list, name)
+
+    def change(self, *args, **kwargs):
+        self.changed = True
+        return method(self, *args, **kwargs)
+    change.__name__ = name
+    return change
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+              'extend', 'insert', 'pop', 'remove', 'clear', 'sort',
+              'reverse'):
+    setattr(_WatchedList, _name, _noteChange(_name))
+del _name
 
 
 class Point(object):
@@ -114,6 +231,8 @@ class Point(object):
 
     """
 
+    __slots__ = ('time', 'mark')
+
     def __init__(self, time, mark):
         self.time = time
         self.mark = mark
@@ -139,6 +258,11 @@ class Point(object):
             return self.time > other
 
     def __eq__(self, other):
+        """
+        In addition to the obvious semantics, a Point is equal to an
+        Interval iff the point is inside the interval (non-inclusively),
+        if you need inclusive membership, use Interval.__contains__
+        """
         if isinstance(other, Point):
             return self.time == other.time
         elif isinstance(other, Interval):
@@ -146,26 +270,12 @@ class Point(object):
         else:
             return self.time == other
 
-    def __gte__(self, other):
+    def __ge__(self, other):
         return self > other or self == other
 
-    def __lte__(self, other):
+    def __le__(self, other):
         return self < other or self == other
 
-    def __cmp__(self, other):
-        """
-        In addition to the obvious semantics, Point/Interval comparison is
-        0 iff the point is inside the interval (non-inclusively), if you
-        need inclusive membership, use Interval.__contains__
-        """
-        if hasattr(other, 'time'):
-            return cmp(self.time, other.time)
-        elif hasattr(other, 'minTime') and hasattr(other, 'maxTime'):
-            return cmp(self.time, other.minTime) + \
-                   cmp(self.time, other.maxTime)
-        else:  # hopefully numerical
-            return cmp(self.time, other)
-
     def __iadd__(self, other):
         self.time += other
 
@@ -173,15 +283,6 @@ class Point(object):
         self.time -= other
 
 
-def decode(string):
-    """
-    Decode HTK's mangling of UTF-8 strings into something useful
-    """
-    # print(string)
-    return string
-    return string.decode('string_escape').decode('UTF-8')
-
-
 class Interval(object):
     """
     Represents an interval of time, with an associated textual mark, as
@@ -189,6 +290,8 @@ class Interval(object):
 
     """
 
+    __slots__ = ('minTime', 'maxTime', 'mark', 'strict')
+
     def __init__(self, minTime, maxTime, mark):
         if minTime >= maxTime:
             # Praat does not support intervals with duration <= 0
@@ -209,56 +312,53 @@ class Interval(object):
         return self.maxTime - self.minTime
 
     def __lt__(self, other):
-        if hasattr(other, 'minTime'):
-            if self.strict and self.overlaps(other):
-                raise (ValueError(self, other))
-            elif self.overlaps(other):
-                logging.warning("Overlap for interval %s: (%f, %f)",
-                                self.mark, self.minTime, self.maxTime)
-                return self.minTime < other.minTime
-            return self.minTime < other.minTime
-        elif hasattr(other, 'time'):
-            return self.maxTime < other.time
-        else:
-            return self.maxTime < other
+        if other.__class__ is not Interval:
+            if other.__class__ in (float, int):
+                return self.maxTime < other
+            elif not hasattr(other, 'minTime'):
+                if hasattr(other, 'time'):
+                    return self.maxTime < other.time
+                return self.maxTime < other
+        # disjoint intervals, the usual case, are ordered by comparing the
+        # end of one with the start of the other
+        if self.maxTime <= other.minTime:
+            return True
+        elif other.maxTime <= self.minTime:
+            return False
+        self._checkOverlap(other)
+        return self.minTime < other.minTime
 
     def __gt__(self, other):
-        if hasattr(other, 'maxTime'):
-            if self.strict and self.overlaps(other):
-                raise (ValueError(self, other))
-            elif self.overlaps(other):
-                logging.warning("Overlap for interval %s: (%f, %f)",
-                                self.mark, self.minTime, self.maxTime)
-                return self.minTime < other.minTime
-            return self.maxTime > other.maxTime
-        elif hasattr(other, 'time'):
-            return self.minTime > other.time
-        else:
-            return self.minTime > other
+        if other.__class__ is not Interval:
+            if other.__class__ in (float, int):
+                return self.minTime > other
+            elif not hasattr(other, 'maxTime'):
+                if hasattr(other, 'time'):
+                    return self.minTime > other.time
+                return self.minTime > other
+        if other.maxTime <= self.minTime:
+            return True
+        elif self.maxTime <= other.minTime:
+            return False
+        self._checkOverlap(other)
+        return self.minTime < other.minTime
+
+    def _checkOverlap(self, other):
+        """
+        Raises a ValueError for overlapping intervals if strict, else
+        logs a warning
+        """
+        if self.strict:
+            raise ValueError(self, other)
+        logging.warning("Overlap for interval %s: (%f, %f)",
+                        self.mark, self.minTime, self.maxTime)
 
-    def __gte__(self, other):
+    def __ge__(self, other):
         return self > other or self == other
 
-    def __lte__(self, other):
+    def __le__(self, other):
         return self < other or self == other
 
-    def __cmp__(self, other):
-        if hasattr(other, 'minTime') and hasattr(other, 'maxTime'):
-            if self.strict and self.overlaps(other):
-                raise ValueError(self, other)
-                # this returns the two intervals, so user can patch things
-                # up if s/he so chooses
-            elif self.overlaps(other):
-                logging.warning("Overlap for interval %s: (%f, %f)",
-                                self.mark, self.minTime, self.maxTime)
-                return cmp(self.minTime, other.minTime)
-            return cmp(self.minTime, other.minTime)
-        elif hasattr(other, 'time'):  # comparing Intervals and Points
-            return cmp(self.minTime, other.time) + \
-                   cmp(self.maxTime, other.time)
-        else:
-            return cmp(self.minTime, other) + cmp(self.maxTime, other)
-
     def __eq__(self, other):
         """
         This might seem superfluous but not that a ValueError will be
@@ -318,7 +418,11 @@ class PointTier(object):
         self.name = name
         self.minTime = minTime
         self.maxTime = maxTime
-        self.points = []
+        self.points = _WatchedList()
+        # the point times, kept parallel to self.points so that searches
+        # bisect over plain floats
+        self._times = []
+        self._timesFor = self.points
 
     def __eq__(self, other):
         if not hasattr(other, 'points'):
@@ -348,14 +452,16 @@ class PointTier(object):
         self.addPoint(Point(time, mark))
 
     def addPoint(self, point):
-        if point < self.minTime:
+        if point.time < self.minTime:
             raise ValueError(self.minTime)  # too early
-        if self.maxTime and point > self.maxTime:
+        if self.maxTime and point.time > self.maxTime:
             raise ValueError(self.maxTime)  # too late
-        i = bisect_left(self.points, point)
-        if i < len(self.points) and self.points[i].time == point.time:
+        i = self._bisect(point.time)
+        times = self._times  # _bisect leaves the keys current
+        if i < len(times) and times[i] == point.time:
             raise ValueError(point)  # we already got one right there
-        self.points.insert(i, point)
+        list.insert(self.points, i, point)
+        times.insert(i, point.time)
 
     def remove(self, time, mark):
         """
@@ -364,7 +470,43 @@ class PointTier(object):
         self.removePoint(Point(time, mark))
 
     def removePoint(self, point):
-        self.points.remove(point)
+        i = self._bisect(point.time)
+        times = self._times  # _bisect leaves the keys current
+        if i == len(times) or times[i] != point.time:
+            raise ValueError(point)
+        list.__delitem__(self.points, i)
+        del times[i]
+
+    def _bisect(self, time):
+        """
+        Returns the index at which time would be inserted among the point
+        times. The cached times either side of it are checked against the
+        Points there, whose times may have been changed in place, and all
+        are rebuilt if they differ.
+        """
+        times = self._timeKeys()
+        i = bisect_left(times, time)
+        points = self.points
+        if (i and points[i - 1].time != times[i - 1]) or \
+                (i != len(times) and points[i].time != times[i]):
+            times = self._timeKeys(rebuild=True)
+            i = bisect_left(times, time)
+        return i
+
+    def _timeKeys(self, rebuild=False):
+        """
+        Returns the list of point times used for bisection, rebuilding it
+        if asked to, or if self.points has been replaced or changed directly
+        """
+        points = self.points
+        if rebuild or self._timesFor is not points or \
+                len(self._times) != len(points) or \
+                getattr(points, 'changed', False):
+            self._times = [point.time for point in points]
+            self._timesFor = points
+            if points.__class__ is _WatchedList:
+                points.changed = False
+        return self._times
 
     def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION):
         """
@@ -372,7 +514,7 @@ class PointTier(object):
         file indicated by string f
         """
         encoding = detectEncoding(f)
-        with codecs.open(f, 'r', encoding=encoding) as source:
+        with open(f, 'r', encoding=encoding, buffering=_BUFFER_SIZE) as source:
             file_type, short = parse_header(source)
             if file_type != 'TextTier':
                 raise TextGridError('The file could not be parsed as a PointTier as it is lacking a proper header.')
@@ -392,19 +534,24 @@ class PointTier(object):
         file. f may be a file object to write to, or a string naming a
         path for writing
        """
-        sink = f if hasattr(f, 'write') else codecs.open(f, 'w', 'UTF-8')
-        print('File type = "ooTextFile"', file=sink)
-        print('Object class = "TextTier"\n', file=sink)
-
-        print('xmin = {0}'.format(self.minTime), file=sink)
-        print('xmax = {0}'.format(self.maxTime if self.maxTime \
-                                      else self.points[-1].time), file=sink)
-        print('points: size = {0}'.format(len(self)), file=sink)
+        sink = f if hasattr(f, 'write') else open(f, 'w', encoding='utf-8',
+                                                 newline='\n',
+                                                 buffering=_BUFFER_SIZE)
+        maxTime = self.maxTime if self.maxTime else self.points[-1].time
+        # build the output up in memory and write it all at once
+        parts = ['File type = "ooTextFile"\n',
+                 'Object class = "TextTier"\n\n',
+                 f'xmin = {self.minTime}\n',
+                 f'xmax = {maxTime}\n',
+                 f'points: size = {len(self)}\n']
         for (i, point) in enumerate(self.points, 1):
-            print('points [{0}]:'.format(i), file=sink)
-            print('\ttime = {0}'.format(point.time), file=sink)
-            mark = _formatMark(point.mark)
-            print('\tmark = "{0}"'.format(mark), file=sink)
+            mark = point.mark
+            if '"' in mark:  # _formatMark, inlined
+                mark = mark.replace('"', '""')
+            parts.append(f'points [{i}]:\n'
+                         f'\ttime = {point.time}\n'
+                         f'\tmark = "{mark}"\n')
+        sink.write(''.join(parts))
         sink.close()
 
     def bounds(self):
@@ -423,7 +570,8 @@ class IntervalTier(object):
     """
     Represents Praat IntervalTiers as list of sequence types of Intervals
     (e.g., for interval in intervaltier). An IntervalTier is used much like a
-    Python set in that it has add/remove methods, not append/extend methods.
+    Python set in that it has add/remove methods, not an append method;
+    extend adds many Intervals at once.
 
     """
 
@@ -431,8 +579,13 @@ class IntervalTier(object):
         self.name = name
         self.minTime = minTime
         self.maxTime = maxTime
-        self.intervals = []
-        self.strict = True
+        self.intervals = _WatchedList()
+        self._strict = True
+        # the interval bounds as parallel columns of plain floats, kept in
+        # step with self.intervals so that searches bisect over floats
+        self._minTimes = []
+        self._maxTimes = []
+        self._timesFor = self.intervals
 
     def __eq__(self, other):
         if not hasattr(other, 'intervals'):
@@ -456,10 +609,21 @@ class IntervalTier(object):
     def __getitem__(self, i):
         return self.intervals[i]
 
+    @property
+    def strict(self):
+        return self._strict
+
+    @strict.setter
+    def strict(self, strict):
+        # the intervals carry the flag for their own comparisons, so they
+        # only need restamping when it actually changes
+        if strict != self._strict:
+            for interval in self.intervals:
+                interval.strict = strict
+        self._strict = strict
+
     def add(self, minTime, maxTime, mark):
-        interval = Interval(minTime, maxTime, mark)
-        interval.strict = self.strict
-        self.addInterval(interval)
+        self.addInterval(Interval(minTime, maxTime, mark))
 
     def addInterval(self, interval):
         if interval.minTime < self.minTime:  # too early
@@ -467,17 +631,136 @@ class IntervalTier(object):
         if self.maxTime and interval.maxTime > self.maxTime:  # too late
             # raise ValueError, self.maxTime
             raise ValueError(self.maxTime)
-        i = bisect_left(self.intervals, interval)
-        if i != len(self.intervals) and self.intervals[i] == interval:
-            raise ValueError(self.intervals[i])
-        interval.strict = self.strict
-        self.intervals.insert(i, interval)
+        i = self._bisect(interval.minTime)
+        # _bisect leaves the keys current
+        minTimes = self._minTimes
+        maxTimes = self._maxTimes
+        # only the would-be neighbours can overlap the new interval
+        if i and maxTimes[i - 1] > interval.minTime:
+            self._overlapping(self.intervals[i - 1], interval)
+        if i != len(minTimes) and minTimes[i] < interval.maxTime:
+            self._overlapping(self.intervals[i], interval)
+        j = self._find(interval, i)
+        if j is not None:
+            raise ValueError(self.intervals[j])
+        interval.strict = self._strict
+        list.insert(self.intervals, i, interval)
+        minTimes.insert(i, interval.minTime)
+        maxTimes.insert(i, interval.maxTime)
+
+    def _overlapping(self, other, interval):
+        """
+        Handles interval overlapping other, already in the tier: this is
+        an error for strict tiers and a warning otherwise
+        """
+        if self.strict:
+            # this returns the two intervals, so user can patch things up
+            raise ValueError(other, interval)
+        logging.warning("Overlap for interval %s: (%f, %f)",
+                        other.mark, other.minTime, other.maxTime)
+
+    def extend(self, intervals, assume_sorted=False):
+        """
+        Adds an iterable of Intervals in one go, which is much faster than
+        repeated calls to addInterval for large batches. If assume_sorted,
+        the intervals must already be in order and come after those in
+        the tier, and are simply appended (out-of-order intervals are
+        still caught as overlaps when strict).
+        """
+        intervals = list(intervals)
+        for interval in intervals:
+            if interval.minTime < self.minTime:  # too early
+                raise ValueError(self.minTime)
+            if self.maxTime and interval.maxTime > self.maxTime:  # too late
+                raise ValueError(self.maxTime)
+            interval.strict = self._strict
+        if assume_sorted:
+            ordered = self.intervals[-1:] + intervals
+        else:
+            ordered = sorted(self.intervals + intervals,
+                             key=attrgetter('minTime'))
+        # in order, an interval can only overlap the one before it
+        for prev, interval in zip(ordered, ordered[1:]):
+            if prev.maxTime > interval.minTime:
+                self._overlapping(prev, interval)
+            if prev.minTime == interval.minTime and \
+                    prev.maxTime == interval.maxTime:
+                raise ValueError(prev)
+        if assume_sorted:
+            minTimes, maxTimes = self._timeKeys()
+            list.extend(self.intervals, intervals)
+            minTimes.extend(interval.minTime for interval in intervals)
+            maxTimes.extend(interval.maxTime for interval in intervals)
+        else:
+            self.intervals[:] = ordered
 
     def remove(self, minTime, maxTime, mark):
         self.removeInterval(Interval(minTime, maxTime, mark))
 
     def removeInterval(self, interval):
-        self.intervals.remove(interval)
+        i = self._find(interval, self._bisect(interval.minTime))
+        if i is None:
+            raise ValueError(interval)
+        list.__delitem__(self.intervals, i)
+        del self._minTimes[i]
+        del self._maxTimes[i]
+
+    def _find(self, interval, i):
+        """
+        Returns the index of the interval with the same bounds as the
+        given one, or None. Such an interval shares its minTime, so can
+        only sit from the bisection point i onwards; this compares the
+        bounds rather than calling Interval.__eq__
+        """
+        intervals = self.intervals
+        while i != len(intervals) and \
+                intervals[i].minTime == interval.minTime:
+            if intervals[i].maxTime == interval.maxTime:
+                return i
+            i += 1
+
+    def _bisect(self, time, ends=False):
+        """
+        Returns the index at which time would be inserted among the
+        interval minTimes, or among the maxTimes if ends. The cached bounds
+        either side of it are checked against the Intervals there, whose
+        times may have been changed in place, and all are rebuilt if they
+        differ.
+        """
+        minTimes, maxTimes = self._timeKeys()
+        i = bisect_left(maxTimes if ends else minTimes, time)
+        intervals = self.intervals
+        if i:
+            before = intervals[i - 1]
+            stale = before.minTime != minTimes[i - 1] or \
+                before.maxTime != maxTimes[i - 1]
+        else:
+            stale = False
+        if not stale and i != len(minTimes):
+            after = intervals[i]
+            stale = after.minTime != minTimes[i] or \
+                after.maxTime != maxTimes[i]
+        if stale:
+            minTimes, maxTimes = self._timeKeys(rebuild=True)
+            i = bisect_left(maxTimes if ends else minTimes, time)
+        return i
+
+    def _timeKeys(self, rebuild=False):
+        """
+        Returns the lists of interval minTimes and maxTimes used for
+        bisection, rebuilding them if asked to, or if self.intervals has
+        been replaced or changed directly
+        """
+        intervals = self.intervals
+        if rebuild or self._timesFor is not intervals or \
+                len(self._minTimes) != len(intervals) or \
+                getattr(intervals, 'changed', False):
+            self._minTimes = [interval.minTime for interval in intervals]
+            self._maxTimes = [interval.maxTime for interval in intervals]
+            self._timesFor = intervals
+            if intervals.__class__ is _WatchedList:
+                intervals.changed = False
+        return (self._minTimes, self._maxTimes)
 
     def indexContaining(self, time):
         """
@@ -485,11 +768,11 @@ class IntervalTier(object):
         or None if the time point is outside the bounds of this tier. The
         argument can be a numeric type, or a Point object.
         """
-        i = bisect_left(self.intervals, time)
-        if i != len(self.intervals):
-            if self.intervals[i].minTime <= time <= \
-                    self.intervals[i].maxTime:
-                return i
+        if hasattr(time, 'time'):
+            time = time.time
+        i = self._bisect(time, ends=True)
+        if i != len(self.intervals) and self.intervals[i].minTime <= time:
+            return i
 
     def intervalContaining(self, time):
         """
@@ -507,7 +790,7 @@ class IntervalTier(object):
         file indicated by string f
         """
         encoding = detectEncoding(f)
-        with codecs.open(f, 'r', encoding=encoding) as source:
+        with open(f, 'r', encoding=encoding, buffering=_BUFFER_SIZE) as source:
             file_type, short = parse_header(source)
             if file_type != 'IntervalTier':
                 raise TextGridError('The file could not be parsed as a IntervalTier as it is lacking a proper header.')
@@ -515,27 +798,47 @@ class IntervalTier(object):
             self.minTime = parse_line(source.readline(), short, round_digits)
             self.maxTime = parse_line(source.readline(), short, round_digits)
             n = int(parse_line(source.readline(), short, round_digits))
-            for i in range(n):
-                source.readline().rstrip()  # header
-                imin = parse_line(source.readline(), short, round_digits)
-                imax = parse_line(source.readline(), short, round_digits)
-                imrk = _getMark(source, short)
-                self.intervals.append(Interval(imin, imax, imrk))
+            # parse all the intervals in one scan over the rest of the file
+            pattern = _INTERVAL_SHORT_RE if short else _INTERVAL_LONG_RE
+            intervals = [Interval(round(float(m.group(1)), round_digits),
+                                  round(float(m.group(2)), round_digits),
+                                  m.group(3).replace('""', '"'))
+                         for m in islice(pattern.finditer(source.read()), n)]
+            if len(intervals) != n:
+                raise TextGridError('The file could not be parsed as a IntervalTier as it has {0} intervals, not {1}.'.format(len(intervals), n))
+            self.intervals.extend(intervals)
 
     def _fillInTheGaps(self, null):
         """
         Returns a pseudo-IntervalTier with the temporal gaps filled in
         """
-        prev_t = self.minTime
-        output = []
-        for interval in self.intervals:
-            if prev_t < interval.minTime:
-                output.append(Interval(prev_t, interval.minTime, null))
-            output.append(interval)
-            prev_t = interval.maxTime
+        intervals = self.intervals
+        if intervals:
+            # find all the gaps at once: interval k follows a gap if it
+            # starts after the end of interval k - 1 (or the tier start)
+            minTimes = np.array([i.minTime for i in intervals], dtype=float)
+            maxTimes = np.array([i.maxTime for i in intervals], dtype=float)
+            gaps = np.flatnonzero(minTimes > np.concatenate(
+                ([self.minTime], maxTimes[:-1]))).tolist()
+            last_t = intervals[-1].maxTime
+        else:
+            gaps = []
+            last_t = self.minTime
+        # also false if maxTime isn't defined
+        fill_end = self.maxTime is not None and last_t < self.maxTime
+        # the size is known exactly, so fill in a preallocated list, with
+        # j counting the gaps placed so far
+        output = [None] * (len(intervals) + len(gaps) + fill_end)
+        start = 0
+        for (j, k) in enumerate(gaps):
+            output[start + j:k + j] = intervals[start:k]
+            prev_t = intervals[k - 1].maxTime if k else self.minTime
+            output[k + j] = Interval(prev_t, intervals[k].minTime, null)
+            start = k
+        output[start + len(gaps):len(intervals) + len(gaps)] = intervals[start:]
         # last interval
-        if self.maxTime is not None and prev_t < self.maxTime:  # also false if maxTime isn't defined
-            output.append(Interval(prev_t, self.maxTime, null))
+        if fill_end:
+            output[-1] = Interval(last_t, self.maxTime, null)
         return output
 
     def write(self, f, null=''):
@@ -544,22 +847,27 @@ class IntervalTier(object):
         may be a file object to write to, or a string naming a path for
         writing
         """
-        sink = f if hasattr(f, 'write') else open(f, 'w')
-        print('File type = "ooTextFile"', file=sink)
-        print('Object class = "IntervalTier"\n', file=sink)
-        print('xmin = {0}'.format(self.minTime), file=sink)
-        print('xmax = {0}'.format(self.maxTime if self.maxTime \
-                                      else self.intervals[-1].maxTime), file=sink)
+        sink = f if hasattr(f, 'write') else open(f, 'w', encoding='utf-8',
+                                                 newline='\n',
+                                                 buffering=_BUFFER_SIZE)
+        maxTime = self.maxTime if self.maxTime else self.intervals[-1].maxTime
         # compute the number of intervals and make the empty ones
         output = self._fillInTheGaps(null)
-        # write it all out
-        print('intervals: size = {0}'.format(len(output)), file=sink)
+        # build it all up in memory and write it out at once
+        parts = ['File type = "ooTextFile"\n',
+                 'Object class = "IntervalTier"\n\n',
+                 f'xmin = {self.minTime}\n',
+                 f'xmax = {maxTime}\n',
+                 f'intervals: size = {len(output)}\n']
         for (i, interval) in enumerate(output, 1):
-            print('intervals [{0}]'.format(i), file=sink)
-            print('\txmin = {0}'.format(interval.minTime), file=sink)
-            print('\txmax = {0}'.format(interval.maxTime), file=sink)
-            mark = _formatMark(interval.mark)
-            print('\ttext = "{0}"'.format(mark), file=sink)
+            mark = interval.mark
+            if '"' in mark:  # _formatMark, inlined
+                mark = mark.replace('"', '""')
+            parts.append(f'intervals [{i}]\n'
+                         f'\txmin = {interval.minTime}\n'
+                         f'\txmax = {interval.maxTime}\n'
+                         f'\ttext = "{mark}"\n')
+        sink.write(''.join(parts))
         sink.close()
 
     def bounds(self):
@@ -570,27 +878,54 @@ class IntervalTier(object):
     @classmethod
     def fromFile(cls, f, name=None):
         it = cls(name=name)
-        it.intervals = []
         it.read(f)
         return it
 
 
+def _parse_nums_long(lines, to_round):
+    """
+    Parse and round the values on a list of numeric lines in one go, as
+    _parse_num_long would each of them
+    """
+    values = np.array([line.partition(' = ')[2] for line in lines],
+                      dtype=float)
+    return _roundTimes(values, 1., to_round).tolist()
+
+
+def _parse_nums_short(lines, to_round):
+    """
+    As _parse_nums_long, for short-format lines
+    """
+    return _roundTimes(np.array(lines, dtype=float), 1., to_round).tolist()
+
+
+def _parse_num_long(line, to_round):
+    return round(float(line.partition(' = ')[2]), to_round)
+
+
+def _parse_str_long(line):
+    return line.partition(' = ')[2].strip()[1:-1]
+
+
+def _parse_num_short(line, to_round):
+    return round(float(line), to_round)
+
+
+def _parse_str_short(line):
+    return line.strip()[1:-1]
+
+
 def parse_line(line, short, to_round):
-    line = line.strip()
-    if short:
-        if '"' in line:
-            return line[1:-1]
-        return round(float(line), to_round)
     if '"' in line:
-        m = re.match(r'.+? = "(.*)"', line)
-        return m.groups()[0]
-    m = re.match(r'.+? = (.*)', line)
-    return round(float(m.groups()[0]), to_round)
+        return _parse_str_short(line) if short else _parse_str_long(line)
+    if short:
+        return _parse_num_short(line, to_round)
+    return _parse_num_long(line, to_round)
 
 
 def parse_header(source):
     header = source.readline()  # header junk
-    m = re.match(r'File type = "([\w ]+)"', header)
+    m = _FILE_TYPE_RE.match(header)
     if m is None or not m.groups()[0].startswith('ooTextFile'):
         raise TextGridError('The file could not be parsed as a Praat text file as it is lacking a proper header.')
 
@@ -600,6 +935,82 @@ def parse_header(source):
     return (file_type, short)
 
 
+def _parseTier(lines, i, short, round_digits, strict, tiers=None):
+    """
+    Parse the TextGrid tier starting at lines[i], a list of lines without
+    their line endings. Returns the tier and the index of the line
+    following it. This is the per-entry kernel of TextGrid.read. If tiers
+    is given and does not contain the tier's name, its entries are only
+    skimmed over and the tier returned is None.
+    """
+    # pick the line parsers once, rather than on every line
+    if short:
+        parse_num = _parse_num_short
+        parse_nums = _parse_nums_short
+        parse_str = _parse_str_short
+    else:
+        parse_num = _parse_num_long
+        parse_nums = _parse_nums_long
+        parse_str = _parse_str_long
+        i += 1
+    # and bind the per-entry helpers to locals for the inner loops
+    get_mark = _getMarkAt
+    make_interval = Interval
+    make_point = Point
+    tier_class = parse_str(lines[i])
+    inam = parse_str(lines[i + 1])
+    imin = parse_num(lines[i + 2], round_digits)
+    imax = parse_num(lines[i + 3], round_digits)
+    n = int(parse_num(lines[i + 4], round_digits))
+    i += 5
+    if tiers is not None and inam not in tiers:
+        # an interval has its times before the mark, a point its time
+        offset = (2 if tier_class == 'IntervalTier' else 1) + (not short)
+        for _ in range(n):
+            i = _skipMarkAt(lines, i + offset)
+        return (None, i)
+    if tier_class == 'IntervalTier':
+        itie = IntervalTier(inam, imin, imax)
+        itie.strict = strict
+        # collect the times and marks into lists of the known size
+        # first, and then convert all the times together
+        starts = [None] * n
+        ends = [None] * n
+        marks = [None] * n
+        for j in range(n):
+            if not short:
+                i += 1  # header junk
+            starts[j] = lines[i]
+            ends[j] = lines[i + 1]
+            marks[j], i = get_mark(lines, i + 2, short)
+        add_interval = itie.addInterval
+        for (jmin, jmax, jmrk) in zip(parse_nums(starts, round_digits),
+                                      parse_nums(ends, round_digits),
+                                      marks):
+            if jmin < jmax:  # non-null
+                add_interval(make_interval(jmin, jmax, jmrk))
+    else:  # pointTier
+        itie = PointTier(inam)
+        times = [None] * n
+        marks = [None] * n
+        for j in range(n):
+            if not short:
+                i += 1  # header junk
+            times[j] = lines[i]
+            marks[j], i = get_mark(lines, i + 1, short)
+        add_point = itie.addPoint
+        for (jtim, jmrk) in zip(parse_nums(times, round_digits), marks):
+            add_point(make_point(jtim, jmrk))
+    return (itie, i)
+
+
+# the compiled kernel, when the optional extension has been built
+try:
+    from ._tgparser import parse_tier as _readTier
+except ImportError:
+    _readTier = _parseTier
+
+
 class TextGrid(object):
     """
     Represents Praat TextGrids as list of sequence types of tiers (e.g.,
@@ -627,8 +1038,9 @@ class TextGrid(object):
     def __eq__(self, other):
         if not hasattr(other, 'tiers'):
             return False
-        else:
-            return all([a == b for a, b in zip(self.tiers, other.tiers)])
+        if len(self.tiers) != len(other.tiers):
+            return False
+        return all(a == b for a, b in zip(self.tiers, other.tiers))
 
     def __str__(self):
         return '<TextGrid {0}, {1} Tiers>'.format(self.name, len(self))
@@ -677,14 +1089,12 @@ class TextGrid(object):
         if self.maxTime is not None and tier.maxTime is not None and tier.maxTime > self.maxTime:
             raise ValueError(self.maxTime)  # too late
         tier.strict = self.strict
-        for i in tier:
-            i.strict = self.strict
         self.tiers.append(tier)
 
     def extend(self, tiers):
-        if min([t.minTime for t in tiers]) < self.minTime:
+        if min(t.minTime for t in tiers) < self.minTime:
             raise ValueError(self.minTime)  # too early
-        if self.maxTime and max([t.minTime for t in tiers]) > self.maxTime:
+        if self.maxTime and max(t.minTime for t in tiers) > self.maxTime:
             raise ValueError(self.maxTime)  # too late
         self.tiers.extend(tiers)
 
@@ -695,64 +1105,54 @@ class TextGrid(object):
         """
         return (self.tiers.pop(i) if i else self.tiers.pop())
 
-    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION, encoding=None):
+    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION, encoding=None,
+             tiers=None):
         """
         Read the tiers contained in the Praat-formatted TextGrid file
         indicated by string f. Times are rounded to the specified precision.
+        If tiers is given, only the tiers with names in it (or the name it
+        is, if a string) are read, and the others are skipped without
+        parsing their contents.
         """
+        if tiers is not None:
+            tiers = {tiers} if isinstance(tiers, str) else set(tiers)
         if encoding is None:
             encoding = detectEncoding(f)
-        with codecs.open(f, 'r', encoding=encoding) as source:
+        with open(f, 'r', encoding=encoding, buffering=_BUFFER_SIZE) as source:
             file_type, short = parse_header(source)
             if file_type != 'TextGrid':
                 raise TextGridError('The file could not be parsed as a TextGrid as it is lacking a proper header.')
+            # read the rest in one go, then walk through its lines by index
+            lines = source.read().split('\n')
 
-            first_line_beside_header = source.readline()
+        first_line_beside_header = lines[0]
+        # parse the first line just once, and as a long-format line only
+        # if the header doesn't already say the file is in short format
+        if not short:
             try:
-                parse_line(first_line_beside_header, short, round_digits)
+                self.minTime = _parse_num_long(first_line_beside_header,
+                                               round_digits)
             except Exception:
                 short = True
+        if short:
+            parse_num = _parse_num_short
+            self.minTime = parse_num(first_line_beside_header, round_digits)
+        else:
+            parse_num = _parse_num_long
 
-            self.minTime = parse_line(first_line_beside_header, short, round_digits)
-            self.maxTime = parse_line(source.readline(), short, round_digits)
-            source.readline()  # more header junk
-            if short:
-                m = int(source.readline().strip())  # will be self.n
-            else:
-                m = int(source.readline().strip().split()[2])  # will be self.n
-            if not short:
-                source.readline()
-            for i in range(m):  # loop over grids
-                if not short:
-                    source.readline()
-                if parse_line(source.readline(), short, round_digits) == 'IntervalTier':
-                    inam = parse_line(source.readline(), short, round_digits)
-                    imin = parse_line(source.readline(), short, round_digits)
-                    imax = parse_line(source.readline(), short, round_digits)
-                    itie = IntervalTier(inam, imin, imax)
-                    itie.strict = self.strict
-                    n = int(parse_line(source.readline(), short, round_digits))
-                    for j in range(n):
-                        if not short:
-                            source.readline().rstrip().split()  # header junk
-                        jmin = parse_line(source.readline(), short, round_digits)
-                        jmax = parse_line(source.readline(), short, round_digits)
-                        jmrk = _getMark(source, short)
-                        if jmin < jmax:  # non-null
-                            itie.addInterval(Interval(jmin, jmax, jmrk))
-                    self.append(itie)
-                else:  # pointTier
-                    inam = parse_line(source.readline(), short, round_digits)
-                    imin = parse_line(source.readline(), short, round_digits)
-                    imax = parse_line(source.readline(), short, round_digits)
-                    itie = PointTier(inam)
-                    n = int(parse_line(source.readline(), short, round_digits))
-                    for j in range(n):
-                        source.readline().rstrip()  # header junk
-                        jtim = parse_line(source.readline(), short, round_digits)
-                        jmrk = _getMark(source, short)
-                        itie.addPoint(Point(jtim, jmrk))
-                    self.append(itie)
+        self.maxTime = parse_num(lines[1], round_digits)
+        # lines[2] is more header junk
+        if short:
+            m = int(lines[3].strip())  # will be self.n
+            i = 4
+        else:
+            m = int(lines[3].strip().split()[2])  # will be self.n
+            i = 5
+        for _ in range(m):  # loop over grids
+            itie, i = _readTier(lines, i, short, round_digits, self.strict,
+                                 tiers)
+            if itie is not None:
+                self.append(itie)
 
     def write(self, f, null=''):
         """
@@ -760,59 +1160,86 @@ class TextGrid(object):
         be a file object to write to, or a string naming a path to open
         for writing.
         """
-        sink = f if hasattr(f, 'write') else codecs.open(f, 'w', 'UTF-8')
-        print('File type = "ooTextFile"', file=sink)
-        print('Object class = "TextGrid"\n', file=sink)
-        print('xmin = {0}'.format(self.minTime), file=sink)
+        sink = f if hasattr(f, 'write') else open(f, 'w', encoding='utf-8',
+                                                 newline='\n',
+                                                 buffering=_BUFFER_SIZE)
+        # build the whole file and hand it to the sink in one write
+        parts = []
+        append = parts.append
         # compute max time
         maxT = self.maxTime
         if not maxT:
-            maxT = max([t.maxTime if t.maxTime else t[-1].maxTime \
-                        for t in self.tiers])
-        print('xmax = {0}'.format(maxT), file=sink)
-        print('tiers? <exists>', file=sink)
-        print('size = {0}'.format(len(self)), file=sink)
-        print('item []:', file=sink)
+            maxT = max(t.maxTime if t.maxTime else t[-1].maxTime
+                       for t in self.tiers)
+        # escaped marks, so that each distinct mark with double-quotes in
+        # it is only escaped once per write
+        escaped = {}
+        append('File type = "ooTextFile"\n'
+               'Object class = "TextGrid"\n\n'
+               f'xmin = {self.minTime}\n'
+               f'xmax = {maxT}\n'
+               'tiers? <exists>\n'
+               f'size = {len(self)}\n'
+               'item []:\n')
         for (i, tier) in enumerate(self.tiers, 1):
-            print('\titem [{0}]:'.format(i), file=sink)
+            append(f'\titem [{i}]:\n')
             if tier.__class__ == IntervalTier:
-                print('\t\tclass = "IntervalTier"', file=sink)
-                print('\t\tname = "{0}"'.format(tier.name), file=sink)
-                print('\t\txmin = {0}'.format(tier.minTime), file=sink)
-                print('\t\txmax = {0}'.format(maxT), file=sink)
                 # compute the number of intervals and make the empty ones
                 output = tier._fillInTheGaps(null)
-                print('\t\tintervals: size = {0}'.format(
-                    len(output)), file=sink)
+                append('\t\tclass = "IntervalTier"\n'
+                       f'\t\tname = "{tier.name}"\n'
+                       f'\t\txmin = {tier.minTime}\n'
+                       f'\t\txmax = {maxT}\n'
+                       f'\t\tintervals: size = {len(output)}\n')
                 for (j, interval) in enumerate(output, 1):
-                    print('\t\t\tintervals [{0}]:'.format(j), file=sink)
-                    print('\t\t\t\txmin = {0}'.format(
-                        interval.minTime), file=sink)
-                    print('\t\t\t\txmax = {0}'.format(
-                        interval.maxTime), file=sink)
-                    mark = _formatMark(interval.mark)
-                    print('\t\t\t\ttext = "{0}"'.format(mark), file=sink)
+                    mark = interval.mark
+                    if '"' in mark:  # _formatMark, inlined and cached
+                        escaped_mark = escaped.get(mark)
+                        if escaped_mark is None:
+                            escaped_mark = escaped[mark] = mark.replace('"', '""')
+                        mark = escaped_mark
+                    append(f'\t\t\tintervals [{j}]:\n'
+                           f'\t\t\t\txmin = {interval.minTime}\n'
+                           f'\t\t\t\txmax = {interval.maxTime}\n'
+                           f'\t\t\t\ttext = "{mark}"\n')
             elif tier.__class__ == PointTier:  # PointTier
-                print('\t\tclass = "TextTier"', file=sink)
-                print('\t\tname = "{0}"'.format(tier.name), file=sink)
-                print('\t\txmin = {0}'.format(tier.minTime), file=sink)
-                print('\t\txmax = {0}'.format(maxT), file=sink)
-                print('\t\tpoints: size = {0}'.format(len(tier)), file=sink)
+                append('\t\tclass = "TextTier"\n'
+                       f'\t\tname = "{tier.name}"\n'
+                       f'\t\txmin = {tier.minTime}\n'
+                       f'\t\txmax = {maxT}\n'
+                       f'\t\tpoints: size = {len(tier)}\n')
                 for (k, point) in enumerate(tier, 1):
-                    print('\t\t\tpoints [{0}]:'.format(k), file=sink)
-                    print('\t\t\t\ttime = {0}'.format(point.time), file=sink)
-                    mark = _formatMark(point.mark)
-                    print('\t\t\t\tmark = "{0}"'.format(mark), file=sink)
+                    mark = point.mark
+                    if '"' in mark:  # _formatMark, inlined and cached
+                        escaped_mark = escaped.get(mark)
+                        if escaped_mark is None:
+                            escaped_mark = escaped[mark] = mark.replace('"', '""')
+                        mark = escaped_mark
+                    append(f'\t\t\tpoints [{k}]:\n'
+                           f'\t\t\t\ttime = {point.time}\n'
+                           f'\t\t\t\tmark = "{mark}"\n')
+        sink.write(''.join(parts))
         sink.close()
 
     # alternative constructor
 
     @classmethod
-    def fromFile(cls, f, name=None):
+    def fromFile(cls, f, name=None, tiers=None):
         tg = cls(name=name)
-        tg.read(f)
+        tg.read(f, tiers=tiers)
         return tg
 
+    @classmethod
+    def fromFiles(cls, paths, max_workers=None, tiers=None):
+        """
+        Read many TextGrid files, returning a list of TextGrids in the
+        order of paths. The files are read by a pool of up to max_workers
+        threads, so that reading one overlaps with parsing another.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(partial(cls.fromFile, tiers=tiers),
+                                     paths))
+
 
 class MLF(object):
     """
@@ -847,53 +1274,71 @@ class MLF(object):
         return self.grids[i]
 
     def read(self, f, samplerate, round_digits=DEFAULT_MLF_PRECISION):
-        source = open(f, 'r')  # HTK returns ostensible ASCII
-
-        source.readline()  # header
-        while True:  # loop over text
-            name = re.match('\"(.*)\"', source.readline().rstrip())
-            if name:
-                name = name.groups()[0]
-                grid = TextGrid(name)
-                phon = IntervalTier(name='phones')
-                word = IntervalTier(name='words')
-                wmrk = ''
-                wsrt = 0.
-                wend = 0.
-                while 1:  # loop over the lines in each grid
-                    line = source.readline().rstrip().split()
-                    if len(line) == 4:  # word on this baby
-                        pmin = round(float(line[0]) / samplerate, round_digits)
-                        pmax = round(float(line[1]) / samplerate, round_digits)
-                        if pmin == pmax:
-                            raise ValueError('null duration interval')
-                        phon.add(pmin, pmax, line[2])
+        with open(f, 'r') as source:  # HTK returns ostensible ASCII
+            lines = source.read().splitlines()
+
+        n = len(lines)
+        i = 1  # skip the header
+        # collect the lines of each grid, up to its closing period
+        grids = []
+        rows = []
+        append = rows.append
+        while i < n:  # loop over text
+            name = _MLF_NAME_RE.match(lines[i].rstrip())
+            if not name:
+                break
+            i += 1
+            start = len(rows)
+            while i < n:
+                line = lines[i].split()
+                i += 1
+                if len(line) not in (3, 4):  # it's a period
+                    break
+                append(line)
+            grids.append((name.groups()[0], start, len(rows)))
+        # convert the start and end columns of the whole file to seconds
+        # in one go
+        samples = np.array([t for line in rows for t in line[:2]],
+                           dtype=np.float64)
+        times = _roundTimes(samples, float(samplerate), round_digits)
+        times = times.reshape(-1, 2).tolist()
+
+        for (name, start, stop) in grids:
+            grid = TextGrid(name)
+            phon = IntervalTier(name='phones')
+            word = IntervalTier(name='words')
+            # MLF intervals come in order, so they can be added in bulk
+            phones = []
+            words = []
+            wmrk = ''
+            wsrt = 0.
+            wend = 0.
+            for line, (pmin, pmax) in zip(rows[start:stop], times[start:stop]):
+                if len(line) == 4:  # word on this baby
+                    if pmin == pmax:
+                        raise ValueError('null duration interval')
+                    phones.append(Interval(pmin, pmax, line[2]))
+                    if wmrk:
+                        words.append(Interval(wsrt, wend, wmrk))
+                    wmrk = line[3]
+                    wsrt = pmin
+                    wend = pmax
+                else:  # just phone
+                    if line[2] == 'sp' and pmin != pmax:
                         if wmrk:
-                            word.add(wsrt, wend, wmrk)
-                        wmrk = decode(line[3])
+                            words.append(Interval(wsrt, wend, wmrk))
+                        wmrk = line[2]
                         wsrt = pmin
                         wend = pmax
-                    elif len(line) == 3:  # just phone
-                        pmin = round(float(line[0]) / samplerate, round_digits)
-                        pmax = round(float(line[1]) / samplerate, round_digits)
-                        if line[2] == 'sp' and pmin != pmax:
-                            if wmrk:
-                                word.add(wsrt, wend, wmrk)
-                            wmrk = decode(line[2])
-                            wsrt = pmin
-                            wend = pmax
-                        elif pmin != pmax:
-                            phon.add(pmin, pmax, line[2])
-                        wend = pmax
-                    else:  # it's a period
-                        word.add(wsrt, wend, wmrk)
-                        self.grids.append(grid)
-                        break
-                grid.append(phon)
-                grid.append(word)
-            else:
-                source.close()
-                break
+                    elif pmin != pmax:
+                        phones.append(Interval(pmin, pmax, line[2]))
+                    wend = pmax
+            words.append(Interval(wsrt, wend, wmrk))
+            phon.extend(phones, assume_sorted=True)
+            word.extend(words, assume_sorted=True)
+            self.grids.append(grid)
+            grid.append(phon)
+            grid.append(word)
 
     def write(self, prefix=''):
         """
@@ -907,7 +1352,8 @@ class MLF(object):
         The number of TextGrids is returned.
         """
         for grid in self.grids:
-            root = Path(grid.name).stem
-            my_path = Path(prefix) / f'{root}.TextGrid'
-            grid.write(codecs.open(my_path, 'w', 'UTF-8'))
+            root = os.path.splitext(os.path.basename(grid.name))[0]
+            my_path = os.path.join(prefix, root + '.TextGrid')
+            grid.write(open(my_path, 'w', encoding='utf-8', newline='\n',
+                            buffering=_BUFFER_SIZE))
         return len(self.grids)
@@ -18,6 +18,10 @@ import unittest
 from io import StringIO
 from os import remove
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from tgfmt import textgrid
 
 tg_with_quotes = '''File type = "ooTextFile"
 Object class = "TextGrid"
@@ -55,6 +59,36 @@ item []:
             mark = """event"" with quotes again" 
 '''
 
+short_tg_with_points = '''File type = "ooTextFile short"
+"TextGrid"
+
+0
+1
+<exists>
+2
+"IntervalTier"
+"words"
+0
+1
+2
+0
+0.5
+"Is ""anyone""
+home?"
+0.5
+1
+"no"
+"TextTier"
+"points"
+0
+1
+2
+0.25
+"event"
+0.75
+"another"
+'''
+
 mlf_data = """#!MFL!#
 "foo.lab"
 0 5000000 sil sil
@@ -302,6 +336,19 @@ This latter line shouldn't be pulled in at all.
 not "technically" ill-formed
 line.""")
 
+    def test_multiline_by_index(self):
+        lines = '''            text = "This is an ""annoying"", ""but""
+not ""technically"" ill-formed
+line."
+This latter line shouldn't be pulled in at all.
+'''.split('\n')
+
+        self.assertEqual(tgfmt.textgrid._getMarkAt(lines, 0, False), ("""This is an "annoying", "but"
+not "technically" ill-formed
+line.""", 3))
+        with self.assertRaises(EOFError):
+            tgfmt.textgrid._getMarkAt(lines[:2], 0, False)
+
 
 class TestPointComparison(unittest.TestCase):
 
@@ -320,7 +367,10 @@ class TestPointComparison(unittest.TestCase):
         self.assertLess(self.foo, 4.0)
         self.assertEqual(self.foo, 3.0)
         self.assertFalse(self.foo > 5.0)
-    
+        self.assertLessEqual(self.foo, 3.0)
+        self.assertGreaterEqual(self.bar, 3.0)
+        self.assertFalse(self.foo >= 4.0)
+
     def test_point_interval(self):
         self.assertFalse(self.foo < self.baz)
         self.assertFalse(self.foo == self.baz)
@@ -343,6 +393,15 @@ class TestIntervalComparison(unittest.TestCase):
         self.assertIn(3.0, self.baz)
         self.assertIn(4.0, self.baz)
 
+    def test_overlap_not_strict(self):
+        eggs = tgfmt.Interval(4.0, 6.0, 'eggs')
+        eggs.strict = False
+
+        with self.assertLogs(level='WARNING'):
+            self.assertFalse(eggs < self.baz)
+
+        self.assertRaises(ValueError, self.baz.__lt__, eggs)
+
 
 class TestPointTierComparison(unittest.TestCase):
 
@@ -437,6 +496,12 @@ class TestTextGridComparison(unittest.TestCase):
     def test_textgrid_unequal_different_tier_types(self):
         self.assertNotEqual(self.foo_grid, self.bar_grid)
 
+    def test_textgrid_unequal_different_tier_counts(self):
+        grid = tgfmt.TextGrid()
+        grid.extend(self.baz_grid.tiers + self.foo_grid.tiers)
+        self.assertNotEqual(grid, self.baz_grid)
+        self.assertNotEqual(self.baz_grid, grid)
+
     def test_type_unequal(self):
         self.assertNotEqual(self.foo_tier, self.foo_grid)
 
@@ -460,6 +525,26 @@ class TestPointTier(unittest.TestCase):
         
         self.assertEqual(repr(self.foo), 'PointTier(foo, [Point(2.0, baz), Point(6.0, bar)])')
 
+        self.assertRaises(ValueError, self.foo.remove, 4.0, 'bar')
+
+    def test_add_fail(self):
+        self.foo.points.append(tgfmt.Point(4.0, 'bar'))
+
+        self.assertRaises(ValueError, self.foo.add, 4.0, 'baz')
+        self.assertRaises(ValueError, self.foo.add, -1.0, 'baz')
+
+    def test_change_in_place(self):
+        for k in range(3):
+            self.foo.add(k, str(k))
+        self.foo.points[1] = tgfmt.Point(1.5, 'bar')
+
+        self.assertRaises(ValueError, self.foo.add, 1.5, 'baz')
+
+        self.foo.points[2].time = 2.5
+        self.foo.remove(2.5, '2')
+
+        self.assertEqual(repr(self.foo), 'PointTier(foo, [Point(0, 0), Point(1.5, bar)])')
+
 
 class TestIntervalTier(unittest.TestCase):
 
@@ -493,13 +578,112 @@ class TestIntervalTier(unittest.TestCase):
         
         with self.assertRaisesRegex(ValueError, r'\(Interval\(2.0, 2.5, baz\), Interval\(1.0, 3.0, baz\)\)'):
             self.foo.add(1.0, 3.0, 'baz')
-            
+
+        with self.assertRaisesRegex(ValueError, r'\(Interval\(0.0, 1.0, bar\), Interval\(0.5, 1.5, baz\)\)'):
+            self.foo.add(0.5, 1.5, 'baz')
+
+    def test_add_overlap_not_strict(self):
+        self.foo.strict = False
+        self.foo.add(0.0, 1.0, 'bar')
+        self.foo.add(2.0, 2.5, 'baz')
+
+        with self.assertLogs(level='WARNING'):
+            self.foo.add(0.5, 2.25, 'eggs')
+
+        self.assertEqual(repr(self.foo), 'IntervalTier(foo, [Interval(0.0, 1.0, bar), Interval(0.5, 2.25, eggs), Interval(2.0, 2.5, baz)])')
+
+        with self.assertLogs(level='WARNING'):
+            self.foo.add(0.0, 0.5, 'spam')
+
+        with self.assertLogs(level='WARNING'), self.assertRaisesRegex(ValueError, r'Interval\(0.0, 1.0, bar\)'):
+            self.foo.add(0.0, 1.0, 'ham')
+
+        with self.assertLogs(level='WARNING'):
+            sorted(self.foo.intervals)
+
+        self.foo.strict = True
+
+        self.assertRaises(ValueError, sorted, self.foo.intervals)
+
+    def test_grid_not_strict(self):
+        self.foo.add(0.0, 1.0, 'bar')
+        tgfmt.TextGrid('bar', strict=False).append(self.foo)
+
+        self.assertFalse(self.foo[0].strict)
+
+    def test_extend(self):
+        self.foo.add(1.0, 2.0, 'bar')
+        self.foo.extend([tgfmt.Interval(2.5, 3.0, 'eggs'), tgfmt.Interval(0.0, 1.0, 'spam')])
+
+        self.assertEqual(repr(self.foo), 'IntervalTier(foo, [Interval(0.0, 1.0, spam), Interval(1.0, 2.0, bar), Interval(2.5, 3.0, eggs)])')
+
+        self.foo.extend([tgfmt.Interval(3.0, 3.5, 'ham')], assume_sorted=True)
+
+        self.assertEqual(repr(self.foo[-1]), 'Interval(3.0, 3.5, ham)')
+        self.assertEqual(self.foo.indexContaining(3.25), 3)
+
+    def test_extend_fail(self):
+        self.foo.add(1.0, 2.0, 'bar')
+
+        with self.assertRaisesRegex(ValueError, r'\(Interval\(1.0, 2.0, bar\), Interval\(1.5, 3.0, baz\)\)'):
+            self.foo.extend([tgfmt.Interval(1.5, 3.0, 'baz')])
+
+        with self.assertRaises(ValueError):
+            self.foo.extend([tgfmt.Interval(0.5, 1.0, 'baz')], assume_sorted=True)
+
+        self.assertEqual(repr(self.foo), 'IntervalTier(foo, [Interval(1.0, 2.0, bar)])')
+
     def test_interval_containing(self):
         self.foo.add(0.0, 1.0, 'bar')
         self.foo.add(2.0, 2.5, 'baz')
         
         self.assertEqual(repr(self.foo.intervalContaining(2.25)), 'Interval(2.0, 2.5, baz)')
         self.assertEqual(repr(self.foo.intervalContaining(0.5)), 'Interval(0.0, 1.0, bar)')
+        self.assertIsNone(self.foo.intervalContaining(1.5))
+        self.assertIsNone(self.foo.intervalContaining(3.0))
+
+    def test_index_containing(self):
+        self.foo.add(0.0, 1.0, 'bar')
+        self.foo.add(2.0, 2.5, 'baz')
+        self.foo.remove(0.0, 1.0, 'bar')
+
+        self.assertEqual(self.foo.indexContaining(tgfmt.Point(2.25, 'spam')), 0)
+        self.assertIsNone(self.foo.indexContaining(0.5))
+
+        self.foo.intervals.append(tgfmt.Interval(3.0, 4.0, 'eggs'))
+
+        self.assertEqual(self.foo.indexContaining(3.5), 1)
+
+    def test_change_in_place(self):
+        for k in range(3):
+            self.foo.add(k, k + 1., str(k))
+        self.foo.intervals[1] = tgfmt.Interval(5.0, 6.0, 'bar')
+
+        self.assertEqual(self.foo.indexContaining(5.5), 1)
+        self.assertRaises(ValueError, self.foo.add, 5.0, 6.0, 'baz')
+
+        self.foo.intervals[2].minTime = 7.0
+        self.foo.intervals[2].maxTime = 8.0
+
+        self.assertEqual(self.foo.indexContaining(7.5), 2)
+        self.assertIsNone(self.foo.indexContaining(2.5))
+
+        self.foo.intervals.sort(key=lambda interval: -interval.minTime)
+        self.foo.intervals.reverse()
+        self.foo.remove(7.0, 8.0, '2')
+
+        self.assertEqual(repr(self.foo), 'IntervalTier(foo, [Interval(0, 1.0, 0), Interval(5.0, 6.0, bar)])')
+
+    def test_read_short(self):
+        with open('test_short.IntervalTier', 'w') as it_file:
+            it_file.write('File type = "ooTextFile short"\n"IntervalTier"\n\n0\n1\n2\n'
+                          '0\n0.5\n"""Is anyone home?"""\n0.5\n1\n"asked\n""Pat"""\n')
+        try:
+            foo = tgfmt.IntervalTier.fromFile('test_short.IntervalTier', 'foo')
+        finally:
+            remove('test_short.IntervalTier')
+
+        self.assertEqual(repr(foo), 'IntervalTier(foo, [Interval(0.0, 0.5, "Is anyone home?"), Interval(0.5, 1.0, asked\n"Pat")])')
 
     def test_add_too_late(self):
         foo = tgfmt.IntervalTier('foo', maxTime=3.5)
@@ -575,6 +759,107 @@ class TestReadTextGrid(unittest.TestCase):
         assert abs(tg.tiers[0][0].minTime - 1358.8925) < 0.01
         assert abs(tg.tiers[0][0].maxTime - 1361.8925) < 0.01
 
+    def test_read_short_points(self):
+        with open('test_short_points.TextGrid', 'w') as tg_file:
+            tg_file.write(short_tg_with_points)
+        try:
+            tg = tgfmt.TextGrid.fromFile('test_short_points.TextGrid')
+        finally:
+            remove('test_short_points.TextGrid')
+
+        self.assertEqual(tg[0][0].mark, 'Is "anyone"\nhome?')
+        self.assertEqual(repr(tg[1]), 'PointTier(points, [Point(0.25, event), Point(0.75, another)])')
+
+    def test_read_full_precision(self):
+        # Praat writes times with up to 17 significant digits
+        times = [k * 7.123456789012345 + k / 3. for k in range(201)]
+        tier = tgfmt.IntervalTier('words', 0., times[-1])
+        for (k, (start, end)) in enumerate(zip(times, times[1:])):
+            tier.add(start, end, str(k))
+        tg = tgfmt.TextGrid(maxTime=times[-1])
+        tg.append(tier)
+        tg.write('test_full_precision.TextGrid')
+        try:
+            for digits in (10, 15, 17):
+                tg = tgfmt.TextGrid()
+                tg.read('test_full_precision.TextGrid', round_digits=digits)
+                self.assertEqual([interval.minTime for interval in tg[0]],
+                                 [round(t, digits) for t in times[:-1]])
+                self.assertEqual([interval.maxTime for interval in tg[0]],
+                                 [round(t, digits) for t in times[1:]])
+        finally:
+            remove('test_full_precision.TextGrid')
+
+    def test_read_compiled(self):
+        parse_tier = textgrid._readTier
+        if parse_tier is textgrid._parseTier:
+            # not built along with the package, so compile it here
+            try:
+                import pyximport
+            except ImportError:
+                self.skipTest('Cython is not installed')
+            with TemporaryDirectory() as build_dir:
+                importers = pyximport.install(build_dir=build_dir)
+                try:
+                    from tgfmt._tgparser import parse_tier
+                finally:
+                    pyximport.uninstall(*importers)
+
+        with open('test_double_quotes.TextGrid', 'w') as tg_file:
+            tg_file.write(tg_with_quotes)
+        with open('test_short_points.TextGrid', 'w') as tg_file:
+            tg_file.write(short_tg_with_points)
+        try:
+            for path in (self.short_textgrid_path, self.long_textgrid_path,
+                         'test_double_quotes.TextGrid',
+                         'test_short_points.TextGrid'):
+                with mock.patch.object(textgrid, '_readTier', parse_tier):
+                    tg = tgfmt.TextGrid.fromFile(path)
+                with mock.patch.object(textgrid, '_readTier',
+                                       textgrid._parseTier):
+                    self.assertEqual(repr(tg.tiers),
+                                     repr(tgfmt.TextGrid.fromFile(path).tiers))
+        finally:
+            remove('test_double_quotes.TextGrid')
+            remove('test_short_points.TextGrid')
+
+    def test_read_some_tiers(self):
+        for path in (self.short_textgrid_path, self.long_textgrid_path):
+            tg = tgfmt.TextGrid.fromFile(path, tiers=['word'])
+            self.assertEqual(tg.getNames(), ['word'])
+            self.assertEqual(tg[0], tgfmt.TextGrid.fromFile(path).getFirst('word'))
+            self.assertEqual(tgfmt.TextGrid.fromFile(path, tiers='word').getNames(), ['word'])
+            self.assertEqual(tgfmt.TextGrid.fromFile(path, tiers='words').getNames(), [])
+
+        with open('test_short_points.TextGrid', 'w') as tg_file:
+            tg_file.write(short_tg_with_points)
+        try:
+            tg = tgfmt.TextGrid.fromFile('test_short_points.TextGrid', tiers=['points'])
+        finally:
+            remove('test_short_points.TextGrid')
+
+        self.assertEqual(repr(tg.tiers), '[PointTier(points, [Point(0.25, event), Point(0.75, another)])]')
+
+    def test_read_many(self):
+        paths = [self.short_textgrid_path, self.long_textgrid_path] * 3
+        grids = tgfmt.TextGrid.fromFiles(paths, max_workers=2)
+        self.assertEqual(len(grids), len(paths))
+        for (path, tg) in zip(paths, grids):
+            self.assertEqual(tg, tgfmt.TextGrid.fromFile(path))
+
+    def test_read_encodings(self):
+        expected = {'utf-8': 'utf-8-sig', 'utf-8-sig': 'utf-8-sig',
+                    'utf-16': 'utf-16'}
+        for (encoding, detected) in expected.items():
+            with open('test_encoding.TextGrid', 'w', encoding=encoding) as tg_file:
+                tg_file.write(short_tg_with_points)
+            try:
+                self.assertEqual(tgfmt.textgrid.detectEncoding('test_encoding.TextGrid'), detected)
+                tg = tgfmt.TextGrid.fromFile('test_encoding.TextGrid')
+            finally:
+                remove('test_encoding.TextGrid')
+            self.assertEqual(tg[0][0].mark, 'Is "anyone"\nhome?')
+
 
 
 